@@ -7,6 +7,7 @@ Removes white background and ensures full transparency for NVIDIA logo
 from PIL import Image
 import numpy as np
 import os
+import shutil
 
 def make_logo_transparent(input_path, output_path):
     """Remove white background and make logo fully transparent"""
@@ -74,9 +75,8 @@ def main():
         return False
     
     try:
-        # Create backup of original
-        original = Image.open(input_file)
-        original.save(backup_file)
+        # Create backup of original (byte copy, no decode/re-encode)
+        shutil.copy2(input_file, backup_file)
         print(f"✓ Created backup: {backup_file}")
         
         # Process the logo